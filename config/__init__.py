@@ -1,15 +1,19 @@
-from config import enums
-from config.config import MISSING, Config, EnvMapping
-from config.enums import Env
-from config.envconfig import EnvConfig, DotFile
-from config.exceptions import AlreadySet, InvalidCast, MissingName
-from config.utils import (
-    boolean_cast,
-    comma_separated,
-    valid_path,
-    joined_cast,
-    with_rule,
-)
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from config import enums
+    from config.config import MISSING, Config, EnvMapping
+    from config.enums import Env
+    from config.envconfig import EnvConfig, DotFile
+    from config.exceptions import AlreadySet, InvalidCast, MissingName
+    from config.utils import (
+        boolean_cast,
+        comma_separated,
+        valid_path,
+        joined_cast,
+        with_rule,
+    )
 
 __all__ = (
     "Config",
@@ -29,5 +33,51 @@ __all__ = (
     "with_rule",
 )
 
+# public name -> (module, attribute); a None attribute exports the module itself
+_LAZY: dict[str, tuple[str, str | None]] = {
+    "Config": ("config.config", "Config"),
+    "MISSING": ("config.config", "MISSING"),
+    "EnvMapping": ("config.config", "EnvMapping"),
+    "Env": ("config.enums", "Env"),
+    "MissingName": ("config.exceptions", "MissingName"),
+    "InvalidCast": ("config.exceptions", "InvalidCast"),
+    "EnvConfig": ("config.envconfig", "EnvConfig"),
+    "DotFile": ("config.envconfig", "DotFile"),
+    "AlreadySet": ("config.exceptions", "AlreadySet"),
+    "enums": ("config.enums", None),
+    "boolean_cast": ("config.utils", "boolean_cast"),
+    "comma_separated": ("config.utils", "comma_separated"),
+    "valid_path": ("config.utils", "valid_path"),
+    "joined_cast": ("config.utils", "joined_cast"),
+    "with_rule": ("config.utils", "with_rule"),
+    # submodules stay reachable as attributes, as with eager imports
+    "config": ("config.config", None),
+    "envconfig": ("config.envconfig", None),
+    "exceptions": ("config.exceptions", None),
+    "interface": ("config.interface", None),
+    "utils": ("config.utils", None),
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    """
+    Resolve public names on first access, deferring submodule imports.
+
+    Raises:
+        AttributeError: If the name is not exported by the package.
+    """
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(module_name)
+    value = module if attr is None else getattr(module, attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__, *_LAZY})
+
 
 __version__ = "2.1.0"
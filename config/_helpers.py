@@ -33,6 +33,8 @@ def clean_dotenv_value(value: str) -> str:
 class maybe_result(typing.Generic[P, T]):
     """Raises error if receives None value on .strict()"""
 
+    __slots__ = ("_func",)
+
     def __init__(
         self,
         func: Callable[P, T | None],
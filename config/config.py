@@ -49,6 +49,26 @@ class EnvMapping(MutableMapping[str, str]):
         self.already_read.add(name)
         return val
 
+    def get(self, name: str, default: Any = None) -> Any:
+        """
+        Get the value of the specified environment variable, or a default if it is not set.
+
+        Overrides `Mapping.get` so that a missing name is resolved with a sentinel
+        lookup on the underlying mapping instead of raising and catching a `KeyError`.
+
+        Args:
+            name (str): The name of the environment variable.
+            default (Any, optional): The value to return if the variable is not found. Defaults to None.
+
+        Returns:
+            Any: The value of the environment variable, or the default value.
+        """
+        val = self.mapping.get(name, MISSING)
+        if val is MISSING:
+            return default
+        self.already_read.add(name)
+        return val
+
     def __setitem__(self, name: str, value: str):
         """
         Set the value of the specified environment variable.
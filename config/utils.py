@@ -1,40 +1,65 @@
-from collections.abc import Callable
+import contextlib
+import os
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
 from enum import Enum
-from pathlib import Path
-from shlex import shlex
+from functools import cache, lru_cache
+from time import monotonic
 from types import NoneType
-from typing import Any, Generic, Literal, NamedTuple, TypeVar, overload
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Generic,
+    Literal,
+    NamedTuple,
+    TypeVar,
+    overload,
+)
 
 from config._helpers import maybe_result
 from config.exceptions import InvalidCast, InvalidEnv, MissingName
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_BOOL_TABLE = {
+    "true": True,
+    "false": False,
+    "1": True,
+    "0": False,
+    "": False,
+}
+_BOOL_MAX_LEN = max(map(len, _BOOL_TABLE))
+
 
 @maybe_result
-def boolean_cast(string: str):
+def boolean_cast(string: str | bool):
     """
     Converts a string to its boolean equivalent.
 
     1 and true (case-insensitive) are considered True, everything else is False.
+    Values that already are booleans, such as defaults, are returned as is.
 
     Args:
-        string (str): The string to check if it represents a boolean value.
+        string (str | bool): The string to check if it represents a boolean value.
 
     Returns:
         MaybeResult[P, bool]: A maybe result helper. If called normally, it returns an Optional[bool].
         If called with `.strict(string)`, it raises an error if `boolean_cast` returns None.
         If called with `.optional(string)`, it returns Optional[bool], suppressing exceptions caused by None values.
     """
-    return {
-        "true": True,
-        "false": False,
-        "1": True,
-        "0": False,
-        "": False,
-    }.get(string.lower())
+    if type(string) is bool:
+        return string
+    if len(string) > _BOOL_MAX_LEN:
+        return None
+    return _BOOL_TABLE.get(string.lower())
 
 
 T = TypeVar("T")
 
+# characters shlex treats as quotes, escapes or comment starts
+_SHLEX_SPECIAL = frozenset("'\"\\#")
+
 
 @overload
 def comma_separated(
@@ -52,6 +77,9 @@ def comma_separated(
     """
     Converts a comma-separated string to a tuple of values after applying the given cast function.
 
+    Casters are memoized per cast function, so repeated calls with the same cast return
+    the same callable.
+
     Args:
         cast (Callable[[str], Union[T, str]]): The casting function to apply to each item in the comma-separated string.
             Defaults to `str`.
@@ -60,8 +88,22 @@ def comma_separated(
         Callable[[str], tuple[Union[T, str], ...]]: A callable that returns a tuple containing the casted values
             from the comma-separated string.
     """
+    try:
+        return _cached_comma_separated(cast)
+    except TypeError:
+        # unhashable casts cannot be memoized
+        return _make_comma_separated(cast)
+
 
+def _make_comma_separated(
+    cast: Callable[[str], T | str],
+) -> Callable[[str], tuple[T | str, ...]]:
     def _wrapped(val: str) -> tuple[T | str, ...]:
+        if _SHLEX_SPECIAL.isdisjoint(val):
+            # nothing for shlex to interpret, a plain split is equivalent
+            return tuple(map(cast, map(str.strip, filter(None, val.split(",")))))
+        from shlex import shlex
+
         lex = shlex(val, posix=True)
         lex.whitespace = ","
         lex.whitespace_split = True
@@ -70,13 +112,26 @@ def comma_separated(
     return _wrapped
 
 
+_cached_comma_separated = lru_cache(maxsize=64)(_make_comma_separated)
+
+
 T = TypeVar("T")
 
 
-def valid_path(val: str) -> Path:
+# existing absolute paths are trusted for this many seconds before being checked again
+_PATH_CACHE_TTL = 1.0
+_PATH_CACHE_MAXSIZE = 128
+_path_cache: OrderedDict[str, tuple["Path", float]] = OrderedDict()
+
+
+def valid_path(val: str) -> "Path":
     """
     Converts a string to a Path object and checks if the path exists.
 
+    Absolute paths found to exist are kept in a small LRU cache for `_PATH_CACHE_TTL`
+    seconds, so repeated reads of the same value within that window skip the filesystem
+    check. Relative paths depend on the working directory and are always checked.
+
     Args:
         val (str): The string representing a file path.
 
@@ -86,9 +141,24 @@ def valid_path(val: str) -> Path:
     Returns:
         Path: A Path object representing the file path.
     """
+    cacheable = os.path.isabs(val)
+    now = monotonic()
+    if cacheable:
+        cached = _path_cache.get(val)
+        if cached is not None and now - cached[1] < _PATH_CACHE_TTL:
+            _path_cache.move_to_end(val)
+            return cached[0]
+    from pathlib import Path
+
     valpath = Path(val)
     if not valpath.exists():
+        _path_cache.pop(val, None)
         raise FileNotFoundError(f"Path {valpath!s} is not valid path", valpath)
+    if cacheable:
+        _path_cache[val] = (valpath, now)
+        _path_cache.move_to_end(val)
+        if len(_path_cache) > _PATH_CACHE_MAXSIZE:
+            _path_cache.popitem(last=False)
     return valpath
 
 
@@ -100,13 +170,21 @@ U = TypeVar("U")
 class _JoinedCast(Generic[S, T]):
     """
     A utility class for chaining casting operations.
+
+    The chain is kept flat as a tuple of casts applied in order, so calling a chain of
+    any length costs a single frame.
     """
 
-    def __init__(self, cast: Callable[[S], T]) -> None:
-        self._cast = cast
+    __slots__ = ("_funcs",)
+
+    def __init__(self, *funcs: Callable[[Any], Any]) -> None:
+        self._funcs = funcs
 
     def __call__(self, val: S) -> T:
-        return self._cast(val)
+        result: Any = val
+        for func in self._funcs:
+            result = func(result)
+        return result
 
     def cast(self, cast: Callable[[T], U]) -> "_JoinedCast[S, U]":
         """
@@ -118,23 +196,7 @@ class _JoinedCast(Generic[S, T]):
         Returns:
             _JoinedCast[S, U]: A new `_JoinedCast` instance that applies the chained casting operation.
         """
-        return _JoinedCast(self._make_cast(cast))
-
-    def _make_cast(self, cast: Callable):
-        """
-        Create a new casting operation based on the existing `_JoinedCast` instance.
-
-        Args:
-            cast (Callable): The casting function to apply.
-
-        Returns:
-            Callable: A new casting function that combines the existing casting function and the provided one.
-        """
-
-        def _wrapper(val: Any):
-            return cast(self._cast(val))
-
-        return _wrapper
+        return _JoinedCast(*self._funcs, cast)
 
 
 def joined_cast(cast: Callable[[str], T]) -> _JoinedCast[str, T]:
@@ -180,14 +242,17 @@ LiteralType = type(Literal["Any"])
 
 
 class ArgTuple(NamedTuple):
-    arg: str
-    cast: type
+    arg: Any
+    cast: Callable[[str], Any] | None
+
+
+_NULL_VALUES = frozenset(("null", "none", ""))
 
 
 def null_cast(val: str | None):
     if val is None:
         return
-    if val.casefold() not in ("null", "none", ""):
+    if val.casefold() not in _NULL_VALUES:
         raise InvalidCast("Null values should match ('null', 'none', '')")
     return None
 
@@ -201,23 +266,38 @@ _cast_map: dict[Callable, Callable[[str], Any]] = {
 }
 
 
-def _try_cast(cast: type, val: str) -> Any:
+def _resolve_caster(cast: type) -> Callable[[str], Any] | None:
     caster = _cast_map.get(cast)
-    if caster is None:
-        if issubclass(cast, Enum):
-            caster = cast
-        else:
-            raise InvalidCast("Unknown type used for Literal")
-    try:
-        return caster(val)
-    except Exception:
-        return val
+    if caster is None and issubclass(cast, Enum):
+        caster = cast
+    return caster
+
+
+def _literal_keys(args: tuple[Any, ...]) -> Iterator[str]:
+    """Yields the canonical string spellings of each literal argument."""
+    for arg in args:
+        if arg is None:
+            yield from _NULL_VALUES
+        elif isinstance(arg, bool):
+            yield from (key for key, value in _BOOL_TABLE.items() if value is arg)
+        elif isinstance(arg, Enum):
+            if isinstance(arg.value, str):
+                yield arg.value
+        elif isinstance(arg, bytes):
+            with contextlib.suppress(UnicodeDecodeError):
+                yield arg.decode()
+        elif isinstance(arg, str | int):
+            yield str(arg)
 
 
 def literal_cast(literal_decl: Any):
     """
     Converts a value to one of the literals defined in the provided literal declaration.
 
+    The casters for each literal argument are resolved once, canonical spellings of
+    the arguments are looked up in a precomputed table, and the resulting caster is
+    memoized per ordered list of literal arguments.
+
     Args:
         literal_decl (Any): The literal declaration, typically a `Literal` type annotation.
 
@@ -242,17 +322,44 @@ def literal_cast(literal_decl: Any):
     """
     if not isinstance(literal_decl, LiteralType):
         raise TypeError
-    arg_map = tuple(ArgTuple(arg, type(arg)) for arg in literal_decl.__args__)
+    # Literal equality ignores argument order, and 1 == True, so the cache is keyed
+    # on the ordered, type-qualified arguments instead of the declaration itself
+    return _build_literal_cast(tuple((type(arg), arg) for arg in literal_decl.__args__))
+
+
+@cache
+def _build_literal_cast(
+    typed_args: tuple[tuple[type, Any], ...],
+) -> Callable[[str], Any]:
+    args = tuple(arg for _, arg in typed_args)
+    arg_map = tuple(ArgTuple(arg, _resolve_caster(cast)) for cast, arg in typed_args)
+
+    def _scan(val: str) -> Any:
+        for arg, caster in arg_map:
+            if caster is None:
+                raise InvalidCast("Unknown type used for Literal")
+            try:
+                casted = caster(val)
+            except Exception:
+                casted = val
+            if casted == arg:
+                return arg
+        raise InvalidCast(
+            "Value received does not match any argument from literal",
+            args,
+        )
+
+    # canonical spellings are resolved ahead of time through the same scan,
+    # so a hit returns exactly what scanning would
+    lookup: dict[str, Any] = {}
+    for key in _literal_keys(args):
+        with contextlib.suppress(InvalidCast):
+            lookup.setdefault(key, _scan(key))
 
     def _cast(val: str) -> Any:
-        for arg, cast in arg_map:
-            if _try_cast(cast, val) == arg:
-                return arg
-        else:
-            raise InvalidCast(
-                "Value received does not match any argument from literal",
-                literal_decl.__args__,
-            )
+        if type(val) is str and val in lookup:
+            return lookup[val]
+        return _scan(val)
 
     return _cast
 
@@ -0,0 +1,15 @@
+from collections.abc import Callable
+
+import pytest
+
+import config
+
+
+@pytest.fixture(scope="module")
+def make_cfg() -> Callable[[dict[str, str]], config.Config]:
+    """Factory building a `Config` backed by an isolated `EnvMapping`."""
+
+    def _make_cfg(values: dict[str, str]) -> config.Config:
+        return config.Config(mapping=config.EnvMapping(values))
+
+    return _make_cfg
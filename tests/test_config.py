@@ -1,3 +1,5 @@
+import subprocess
+import sys
 from pathlib import Path
 import pytest
 from hypothesis import given
@@ -74,6 +76,16 @@ def test_env_mapping_raises_errors_correctly_on_read():
         del mapping["my-name"]
 
 
+def test_env_mapping_get_only_marks_found_names_as_read():
+    mapping = config.EnvMapping({"found": "val"})
+
+    assert mapping.get("found") == "val"
+    assert mapping.get("missing", "default") == "default"
+    assert mapping.already_read == {"found"}
+
+    mapping["missing"] = "allowed"
+
+
 def test_config_reads_from_env_file(tmp_path: Path):
     filename = tmp_path / ".envtestfile"
     with open(filename, "w") as buf:
@@ -107,3 +119,37 @@ def test_config_reads_from_env_file(tmp_path: Path):
 
     with pytest.raises(MissingName):
         cfg("EMAIL")
+
+
+def test_package_exports_resolve_lazily():
+    code = (
+        "import sys, config; "
+        "loaded = [name for name in ('config.config', 'config.envconfig') "
+        "if name in sys.modules]; "
+        "assert not loaded, loaded; "
+        "config.Config; "
+        "assert 'config.config' in sys.modules"
+    )
+    subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        cwd=Path(__file__).resolve().parent.parent,
+    )
+
+    for name in config.__all__:
+        assert getattr(config, name) is not None
+        assert name in dir(config)
+
+    with pytest.raises(AttributeError):
+        config.not_exported  # noqa: B018
+
+
+def test_package_exposes_submodules():
+    assert config.exceptions.InvalidEnv.__name__ == "InvalidEnv"
+    assert config.utils.literal_cast is not None
+    assert config.config.Config is config.Config
+    assert config.envconfig.EnvConfig is config.EnvConfig
+    assert config.interface.MISSING is config.MISSING
+    assert {"config", "envconfig", "exceptions", "interface", "utils"} <= set(
+        dir(config)
+    )
@@ -5,54 +5,74 @@ from typing import Literal
 import pytest
 
 import config
+from config import utils
 from config.exceptions import InvalidCast, InvalidEnv, MissingName
 from config.utils import boolean_cast, literal_cast, multicast, none_is_missing
 
 
-def test_comma_separated_returns_valid_split():
-    mapping = config.EnvMapping({"key": "a, b, c"})
-    cfg = config.Config(mapping=mapping)
+@pytest.mark.parametrize(
+    "value,cast,expected",
+    [
+        ("a, b, c", str, ("a", "b", "c")),
+        ("1, 2, 3", int, (1, 2, 3)),
+        ('a,, "b, c" , d', str, ("a", "b, c", "d")),
+    ],
+)
+def test_comma_separated_returns_valid_split(make_cfg, value, cast, expected):
+    cfg = make_cfg({"key": value})
 
-    val = cfg("key", config.comma_separated())
+    val = cfg("key", config.comma_separated(cast))
 
-    assert val == ("a", "b", "c")
+    assert val == expected
 
 
-def test_comma_separated_returns_valid_split_with_cast():
-    mapping = config.EnvMapping({"key": "1, 2, 3"})
-    cfg = config.Config(mapping=mapping)
-    val = cfg("key", config.comma_separated(int))
+def test_comma_separated_is_memoized_per_cast():
+    class Unhashable:
+        __hash__ = None
 
-    assert val == (1, 2, 3)
+        def __call__(self, val: str) -> str:
+            return val.upper()
 
+    assert config.comma_separated(int) is config.comma_separated(int)
+    assert config.comma_separated() is not config.comma_separated(int)
+    assert config.comma_separated(Unhashable())("a, b") == ("A", "B")
 
-def test_boolean_returns_valid_bool():
-    mapping = config.EnvMapping(
-        {"first": "true", "second": "False", "third": "1", "fourth": "0"}
-    )
-    cfg = config.Config(mapping=mapping)
 
-    assert cfg("first", config.boolean_cast)
-    assert not cfg("second", config.boolean_cast)
-    assert cfg("third", config.boolean_cast)
-    assert not cfg("fourth", config.boolean_cast)
+@pytest.mark.parametrize(
+    "value,expected",
+    [("true", True), ("False", False), ("1", True), ("0", False)],
+)
+def test_boolean_returns_valid_bool(make_cfg, value, expected):
+    cfg = make_cfg({"key": value})
+
+    assert cfg("key", config.boolean_cast) is expected
 
 
-def test_boolean_raises_invalid_cast():
+def test_boolean_raises_invalid_cast(make_cfg):
     """test boolean raises invalid cast if
     no boolean definition matches"""
-    mapping = config.EnvMapping({"key": "value"})
-    cfg = config.Config(mapping=mapping)
+    cfg = make_cfg({"key": "value"})
 
     with pytest.raises(config.InvalidCast):
         cfg("key", config.boolean_cast.strict)
 
 
-def test_valid_path_returns_path_object(tmp_path: Path):
+def test_boolean_returns_none_for_unknown_values():
+    assert boolean_cast("yes") is None
+    assert boolean_cast("enabled") is None
+
+
+def test_boolean_accepts_boolean_defaults(make_cfg):
+    cfg = make_cfg({})
+
+    assert cfg("missing", config.boolean_cast, True) is True
+    assert cfg("missing", config.boolean_cast.strict, False) is False
+
+
+def test_valid_path_returns_path_object(make_cfg, tmp_path: Path):
     filepath = tmp_path / "file.txt"
     filepath.touch()
-    mapping = config.EnvMapping({"key": filepath.as_posix()})
-    cfg = config.Config(mapping=mapping)
+    cfg = make_cfg({"key": filepath.as_posix()})
 
     val = cfg("key", config.valid_path)
 
@@ -60,11 +80,53 @@ def test_valid_path_returns_path_object(tmp_path: Path):
     assert val == filepath
 
 
-def test_valid_path_raises_file_not_found_error():
+def test_valid_path_rechecks_cached_paths_after_ttl(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    filepath = tmp_path / "file.txt"
+    filepath.touch()
+
+    assert config.valid_path(filepath.as_posix()) is config.valid_path(
+        filepath.as_posix()
+    )
+
+    filepath.unlink()
+    monkeypatch.setattr(utils, "_PATH_CACHE_TTL", 0)
+    with pytest.raises(FileNotFoundError):
+        config.valid_path(filepath.as_posix())
+
+
+def test_valid_path_checks_relative_paths_against_cwd(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    first, second = tmp_path / "first", tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    (first / "file.txt").touch()
+
+    monkeypatch.chdir(first)
+    assert config.valid_path("file.txt").exists()
+
+    monkeypatch.chdir(second)
+    with pytest.raises(FileNotFoundError):
+        config.valid_path("file.txt")
+
+
+def test_valid_path_cache_is_bounded(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(utils, "_PATH_CACHE_MAXSIZE", 2)
+    monkeypatch.setattr(utils, "_path_cache", type(utils._path_cache)())
+    paths = [(tmp_path / str(idx)).as_posix() for idx in range(5)]
+    for path in paths:
+        Path(path).touch()
+        config.valid_path(path)
+
+    assert list(utils._path_cache) == paths[-2:]
+
+
+def test_valid_path_raises_file_not_found_error(make_cfg):
     """test valid_path raises FileNotFoundError
     if the path does not exist."""
-    mapping = config.EnvMapping({"key": "./non_existent_file.txt"})
-    cfg = config.Config(mapping=mapping)
+    cfg = make_cfg({"key": "./non_existent_file.txt"})
     valpath = Path("./non_existent_file.txt")
 
     with pytest.raises(InvalidCast) as exc_info:
@@ -77,9 +139,8 @@ def test_valid_path_raises_file_not_found_error():
     )
 
 
-def test_joined_cast_composes_cast_functions():
-    mapping = config.EnvMapping({"key": "42"})
-    cfg = config.Config(mapping=mapping)
+def test_joined_cast_composes_cast_functions(make_cfg):
+    cfg = make_cfg({"key": "42"})
 
     # Casting sequence: str -> int -> str -> float
     val = cfg("key", config.joined_cast(str).cast(int).cast(str).cast(float))
@@ -88,9 +149,8 @@ def test_joined_cast_composes_cast_functions():
     assert val == 42.0
 
 
-def test_with_rule_valid_rule():
-    mapping = config.EnvMapping({"key": "42"})
-    cfg = config.Config(mapping=mapping)
+def test_with_rule_valid_rule(make_cfg):
+    cfg = make_cfg({"key": "42"})
 
     # Rule: Value must be greater than 40
     def greater_than_40(x):
@@ -100,11 +160,10 @@ def test_with_rule_valid_rule():
     cfg("key", config.with_rule(greater_than_40))
 
 
-def test_with_rule_invalid_rule():
+def test_with_rule_invalid_rule(make_cfg):
     """test with_rule raises InvalidEnv
     if the rule condition is not met."""
-    mapping = config.EnvMapping({"key": "42"})
-    cfg = config.Config(mapping=mapping)
+    cfg = make_cfg({"key": "42"})
 
     # Rule: Value must be less than 40
     def less_than_40(x):
@@ -122,13 +181,13 @@ def test_with_rule_invalid_rule():
     )
 
 
-def test_literal_cast_returns_valid_cast():
+def test_literal_cast_returns_valid_cast(make_cfg):
     class Test(Enum):
         VALUE = "value"
 
     literal_type = Literal[1, "other", b"another", Test.VALUE, None, False]
     caster = literal_cast(literal_type)
-    mapping = config.EnvMapping(
+    cfg = make_cfg(
         {
             "first": "other",
             "second": "another",
@@ -139,7 +198,6 @@ def test_literal_cast_returns_valid_cast():
             "seventh": "invalid",
         }
     )
-    cfg = config.Config(mapping=mapping)
 
     assert (
         cfg("first", caster),
@@ -166,23 +224,21 @@ def test_literal_cast_returns_valid_cast():
     )
 
 
-def test_none_is_missing():
-    mapping = config.EnvMapping({"key": "null"})
-    cfg = config.Config(mapping=mapping)
+def test_none_is_missing(make_cfg):
+    cfg = make_cfg({"key": "null"})
 
     with pytest.raises(MissingName):
         cfg("key", none_is_missing(boolean_cast.optional))
 
 
-def test_multicast():
+def test_multicast(make_cfg):
     def surely_fails(val):
         raise ValueError("This function does not work")
 
     def returns_anything(val):
         return "anything"
 
-    mapping = config.EnvMapping({"key": "42"})
-    cfg = config.Config(mapping=mapping)
+    cfg = make_cfg({"key": "42"})
 
     assert cfg("key", multicast(int, surely_fails)) == 42
 
@@ -191,3 +247,33 @@ def test_multicast():
     assert exc_info.value.__cause__.args == ("This function does not work",)
 
     assert cfg("key", multicast(returns_anything, surely_fails)) == "anything"
+
+
+def test_literal_cast_is_memoized_per_declaration():
+    assert literal_cast(Literal["a", "b"]) is literal_cast(Literal["a", "b"])
+    assert literal_cast(Literal["a", "b"]) is not literal_cast(Literal["a"])
+
+
+def test_literal_cast_memoization_respects_argument_order():
+    assert literal_cast(Literal[1, True])("1") == 1
+    assert literal_cast(Literal[True, 1])("1") is True
+    assert literal_cast(Literal[None, False])("") is None
+    assert literal_cast(Literal[False, None])("") is False
+
+
+def test_literal_cast_rejects_unknown_types_only_when_reached():
+    caster = literal_cast(Literal[1, 3.0])
+
+    assert caster("1") == 1
+    with pytest.raises(InvalidCast, match="Unknown type used for Literal"):
+        caster("3.0")
+
+
+def test_literal_cast_lookup_matches_scan_order():
+    caster = literal_cast(Literal[1, True, "01"])
+
+    assert type(caster("1")) is int
+    assert caster("true") is True
+    assert caster("01") == 1
+    assert caster("TRUE") is True
+    assert literal_cast(Literal[True, 1])("1") is True